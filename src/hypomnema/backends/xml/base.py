@@ -23,6 +23,9 @@ from hypomnema.backends.xml.namespace import (
 from hypomnema.backends.xml.utils import make_usable_path, normalize_encoding
 
 
+_logger = getLogger(__name__)
+
+
 class XmlBackendLike[E](Protocol):
   """Protocol defining the public contract for XML backends.
 
@@ -207,7 +210,7 @@ class XmlBackend[E](ABC):
     logger: Logger | None = None,
     global_nsmap: MutableMapping[str, str] | None = None,
   ) -> None:
-    self.logger = logger if logger is not None else getLogger(__name__)
+    self.logger = logger if logger is not None else _logger
     self.default_encoding = normalize_encoding(default_encoding)
     self._global_nsmap: dict[str, str] = {}
     if global_nsmap is not None:
@@ -313,6 +316,15 @@ class XmlBackend[E](ABC):
   @abstractmethod
   def append_child(self, parent: E, child: E) -> None: ...
 
+  def extend_children(self, parent: E, children: Iterable[E]) -> None:
+    """Append every element of *children* to *parent*, in order.
+
+    The default delegates to `append_child()`; backends with a native bulk
+    append should override it.
+    """
+    for child in children:
+      self.append_child(parent, child)
+
   @overload
   def get_attribute(self, element: E, name: str | bytes) -> str | None: ...
   @overload
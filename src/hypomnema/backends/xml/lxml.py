@@ -102,6 +102,17 @@ class LxmlBackend(XmlBackend[et._Element]):
     """Append *child* as a subelement of *parent*."""
     parent.append(child)
 
+  def extend_children(self, parent: et._Element, children: Iterable[et._Element]) -> None:
+    """Append every element of *children* to *parent*, in order.
+
+    Uses the native bulk append unless a subclass overrides `append_child()`,
+    in which case every child is routed through that override.
+    """
+    if type(self).append_child is not LxmlBackend.append_child:
+      super().extend_children(parent, children)
+      return
+    parent.extend(children)
+
   @overload
   def get_attribute(
     self, element: et._Element, name: str | bytes, *, nsmap: MutableMapping[str, str] | None = None
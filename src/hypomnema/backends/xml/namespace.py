@@ -19,10 +19,11 @@ merging dicts. The ``"xml"`` prefix is a built-in that always maps to
 
 Registration validates NCNames and URIs via :func:`.validate_ncname` and
 :func:`.validate_uri`. Resolution and formatting are fast hot paths that do
-not re-validate.
+not re-validate, and name parsing is memoized.
 """
 
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import Literal, NamedTuple
 
 from hypomnema.backends.xml.errors import (
@@ -170,12 +171,16 @@ def _lookup_prefix_for_uri(
   raise UnregisteredURIError(uri, {**global_nsmap, **(nsmap or {})})
 
 
+@lru_cache(maxsize=1024)
 def _parse_name(name: str) -> tuple[str | None, str | None, str]:
   """Parse a name string into ``(prefix, uri, localname)`` parts.
 
   Accepts Clark notation (``{uri}local``), prefixed (``prefix:local``),
   default-namespace prefixed (``:local``), or bare local names.
 
+  Parsing does not depend on any namespace map, so results are memoized: a
+  document only ever uses a handful of distinct tag and attribute names.
+
   Returns:
       ``(None, None, localname)`` for bare names.
       ``(None, uri, localname)`` for Clark notation (prefix not yet resolved).
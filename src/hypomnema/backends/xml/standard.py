@@ -83,6 +83,17 @@ class StandardBackend(XmlBackend[et.Element]):
     """Append *child* as a subelement of *parent*."""
     parent.append(child)
 
+  def extend_children(self, parent: et.Element, children: Iterable[et.Element]) -> None:
+    """Append every element of *children* to *parent*, in order.
+
+    Uses the native bulk append unless a subclass overrides `append_child()`,
+    in which case every child is routed through that override.
+    """
+    if type(self).append_child is not StandardBackend.append_child:
+      super().extend_children(parent, children)
+      return
+    parent.extend(children)
+
   @overload
   def get_attribute(
     self, element: et.Element, name: str | bytes, *, nsmap: MutableMapping[str, str] | None = None
@@ -10,12 +10,14 @@ All public validators return ``None`` on success and raise
 identifying the exact check that failed.
 """
 
+import re
 from ipaddress import IPv4Address, IPv6Address
 from unicodedata import category
 
 
 from codecs import lookup
 from encodings import normalize_encoding as python_normalize_encoding
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 from typing import Literal, Protocol, overload, runtime_checkable
@@ -27,11 +29,14 @@ from hypomnema.backends.xml.errors import InvalidNCNameError
 def normalize_encoding(encoding: Literal["unicode"] | None) -> Literal["utf-8"]: ...
 @overload
 def normalize_encoding(encoding: str) -> str: ...
+@lru_cache(maxsize=64)
 def normalize_encoding(encoding: str | None) -> str:
   """Normalize character encoding name to standard form.
 
   Converts encoding names to their canonical form using the Python
-  codec registry. Handles "unicode" as an alias for UTF-8.
+  codec registry. Handles "unicode" as an alias for UTF-8. Results are
+  memoized, since every parse and write normalizes one of a handful of
+  names; unknown encodings are not cached and raise on every call.
 
   Args:
       encoding: Encoding name to normalize. None or "unicode" returns "utf-8".
@@ -111,6 +116,12 @@ _NAME_EXTRA_CHARS = frozenset("\u200c\u200d")
 in XML NameStartChar per XML 1.0 5th Edition §2.3:
 U+200C ZERO WIDTH NON-JOINER and U+200D ZERO WIDTH JOINER."""
 
+_ASCII_NCNAME = re.compile(r"[A-Za-z_][A-Za-z0-9_.-]*")
+"""All-ASCII NCNames, matched in a single C-level scan. Within ASCII the
+category rules above reduce to exactly these characters, so a full match is
+authoritative and only non-ASCII or invalid names need the per-character
+checks."""
+
 
 def _validate_nc_start_char(char: str) -> None:
   """Validate that a character is valid for NCName start.
@@ -172,6 +183,8 @@ def validate_ncname(name: str) -> None:
       >>> validate_ncname("validName")
       >>> validate_ncname("ns:name")  # Raises InvalidNCNameError
   """
+  if _ASCII_NCNAME.fullmatch(name) is not None:
+    return
   try:
     if not name:
       raise InvalidNCNameError("NCName cannot be empty")
@@ -199,6 +212,8 @@ FRAGMENT_CHARS = PCHAR | frozenset("/?")
 
 ALLOWED_IP_LITERAL = UNRESERVED | SUB_DELIMS | frozenset(":")
 
+_PERCENT_ENCODED = re.compile(r"%[0-9A-Fa-f]{2}")
+
 
 def _validate_chars(
   s: str, allowed: frozenset[str], component: str, start_position: int = 0
@@ -218,6 +233,12 @@ def _validate_chars(
       ValueError: If the component contains an invalid character or an
           invalid percent-encoded sequence.
   """
+  # Fast path: with well-formed escapes stripped, the component is valid iff
+  # the set check passes (no allowed set contains "%", so a stray one fails).
+  # The scan below only runs to locate and report the offending character.
+  unescaped = _PERCENT_ENCODED.sub("", s) if "%" in s else s
+  if allowed.issuperset(unescaped):
+    return
   i = 0
   while i < len(s):
     char = s[i]
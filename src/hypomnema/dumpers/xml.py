@@ -12,8 +12,10 @@ node types used alongside the built-in tree.
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
+from datetime import datetime
+from functools import lru_cache
 from logging import Logger, getLogger
-from typing import Protocol, TypeVar, overload
+from typing import Any, Protocol, TypeVar, overload
 
 from hypomnema.backends.xml.base import XmlBackend
 from hypomnema.domain.nodes import (
@@ -35,6 +37,29 @@ from hypomnema.domain.nodes import (
   UnknownNode,
 )
 
+_logger = getLogger(__name__)
+
+
+@lru_cache(maxsize=4096)
+def _format_date_fields(
+  year: int, month: int, day: int, hour: int, minute: int, second: int
+) -> str:
+  return f"{year:04d}{month:02d}{day:02d}T{hour:02d}{minute:02d}{second:02d}Z"
+
+
+def _format_date(value: datetime) -> str:
+  """Format *value* as a TMX ``YYYYMMDDThhmmssZ`` date.
+
+  Exports tend to repeat the same handful of timestamps across thousands of
+  units, so the formatted strings are memoized. The cache is keyed on the
+  wall-clock fields rather than the datetime itself, because aware datetimes
+  compare equal across time zones.
+  """
+  return _format_date_fields(
+    value.year, value.month, value.day, value.hour, value.minute, value.second
+  )
+
+
 DumperType = TypeVar("DumperType", contravariant=True)
 
 
@@ -83,7 +108,7 @@ class XmlDumper[BackendType, NodeType: AnyNode | UnknownNode | UnknownInlineNode
     logger: Logger | None = None,
     overrides: dict[type, XmlRegisteredDumper[BackendType]] | None = None,
   ) -> None:
-    self.logger = logger or getLogger(__name__)
+    self.logger = logger or _logger
     self.backend = backend
     self._overrides = {}
     self._cache = {}
@@ -202,43 +227,19 @@ class XmlDumper[BackendType, NodeType: AnyNode | UnknownNode | UnknownInlineNode
   @overload
   def _get_dumper(self, node_type: type) -> XmlRegisteredDumper[BackendType]: ...
   def _get_dumper(self, node_type: type) -> XmlRegisteredDumper[BackendType]:
-    if node_type in self._overrides:
-      return self._overrides[node_type]
-    if node_type in self._cache:
-      return self._cache[node_type]
-
-    if node_type is Prop:
-      dumper: XmlRegisteredDumper[BackendType] = PropDumper(
-        self.backend, self.logger, self._overrides
-      )
-    elif node_type is Note:
-      dumper = NoteDumper(self.backend, self.logger, self._overrides)
-    elif node_type is TranslationMemoryHeader:
-      dumper = TranslationMemoryHeaderDumper(self.backend, self.logger, self._overrides)
-    elif node_type is Bpt:
-      dumper = BptDumper(self.backend, self.logger, self._overrides)
-    elif node_type is Ept:
-      dumper = EptDumper(self.backend, self.logger, self._overrides)
-    elif node_type is It:
-      dumper = ItDumper(self.backend, self.logger, self._overrides)
-    elif node_type is Ph:
-      dumper = PhDumper(self.backend, self.logger, self._overrides)
-    elif node_type is Hi:
-      dumper = HiDumper(self.backend, self.logger, self._overrides)
-    elif node_type is Sub:
-      dumper = SubDumper(self.backend, self.logger, self._overrides)
-    elif node_type is TranslationVariant:
-      dumper = TranslationVariantDumper(self.backend, self.logger, self._overrides)
-    elif node_type is TranslationUnit:
-      dumper = TranslationUnitDumper(self.backend, self.logger, self._overrides)
-    elif node_type is TranslationMemory:
-      dumper = TranslationMemoryDumper(self.backend, self.logger, self._overrides)
-    elif node_type is UnknownNode:
-      dumper = UnknownNodeDumper(self.backend, self.logger, self._overrides)
-    elif node_type is UnknownInlineNode:
-      dumper = UnknownInlineNodeDumper(self.backend, self.logger, self._overrides)
-    else:
-      raise ValueError(f"No dumper registered for type {node_type!r}")
+    # Called once per nested node: a cached hit costs one probe of each map.
+    dumper = self._overrides.get(node_type)
+    if dumper is not None:
+      return dumper
+    dumper = self._cache.get(node_type)
+    if dumper is not None:
+      return dumper
+
+    try:
+      dumper_cls = _BUILTIN_DUMPERS[node_type]
+    except KeyError:
+      raise ValueError(f"No dumper registered for type {node_type!r}") from None
+    dumper = dumper_cls(self.backend, self.logger, self._overrides)
 
     self._cache[node_type] = dumper
     return dumper
@@ -248,24 +249,30 @@ class XmlDumper[BackendType, NodeType: AnyNode | UnknownNode | UnknownInlineNode
     """Convert one domain node into a backend XML element."""
     ...
 
+  def _append_children(self, elem: BackendType, children: Iterable[BackendType]) -> None:
+    # extend_children is an XmlBackend convenience, not part of XmlBackendLike,
+    # so protocol-only backends and proxies fall back to append_child.
+    if isinstance(self.backend, XmlBackend):
+      self.backend.extend_children(elem, children)
+    else:
+      for child in children:
+        self.backend.append_child(elem, child)
+
   def _add_extra(self, elem: BackendType, node: NodeType) -> None:
     if hasattr(node, "extra_attributes") and node.extra_attributes:
       for name, value in node.extra_attributes.items():
         self.backend.set_attribute(elem, name, str(value))
     if hasattr(node, "extra_nodes") and node.extra_nodes:
       unknown_dumper = self._get_dumper(UnknownNode)
-      for child_node in node.extra_nodes:
-        self.backend.append_child(elem, unknown_dumper.dump(child_node))
+      self._append_children(elem, map(unknown_dumper.dump, node.extra_nodes))
 
   def _add_notes_and_props(self, elem: BackendType, node: NodeType) -> None:
     if hasattr(node, "notes") and node.notes:
       note_dumper = self._get_dumper(Note)
-      for note in node.notes:
-        self.backend.append_child(elem, note_dumper.dump(note))
+      self._append_children(elem, map(note_dumper.dump, node.notes))
     if hasattr(node, "props") and node.props:
       prop_dumper = self._get_dumper(Prop)
-      for prop in node.props:
-        self.backend.append_child(elem, prop_dumper.dump(prop))
+      self._append_children(elem, map(prop_dumper.dump, node.props))
 
   def _populate_content[T: InlineContentItem](
     self, elem: BackendType, content: Iterable[T]
@@ -318,16 +325,16 @@ class PropDumper[BackendType](XmlDumper[BackendType, Prop]):
   """Dump `Prop` nodes as TMX `<prop>` elements."""
 
   def dump(self, node: Prop) -> BackendType:
-    prop_elem = self.backend.create_element(
-      tag="prop", attributes={"type": node.spec_attributes.kind}
-    )
+    spec = node.spec_attributes
+    prop_elem = self.backend.create_element(tag="prop", attributes={"type": spec.kind})
     self.backend.set_text(prop_elem, node.text)
 
-    if node.spec_attributes.language is not None:
-      self.backend.set_attribute(prop_elem, "xml:lang", node.spec_attributes.language)
-    if node.spec_attributes.original_encoding is not None:
-      self.backend.set_attribute(prop_elem, "o-encoding", node.spec_attributes.original_encoding)
-    self._add_extra(prop_elem, node)
+    if spec.language is not None:
+      self.backend.set_attribute(prop_elem, "xml:lang", spec.language)
+    if spec.original_encoding is not None:
+      self.backend.set_attribute(prop_elem, "o-encoding", spec.original_encoding)
+    if node.extra_attributes or node.extra_nodes:
+      self._add_extra(prop_elem, node)
 
     return prop_elem
 
@@ -336,14 +343,16 @@ class NoteDumper[BackendType](XmlDumper[BackendType, Note]):
   """Dump `Note` nodes as TMX `<note>` elements."""
 
   def dump(self, node: Note) -> BackendType:
+    spec = node.spec_attributes
     note_elem = self.backend.create_element(tag="note")
     self.backend.set_text(note_elem, node.text)
 
-    if node.spec_attributes.language is not None:
-      self.backend.set_attribute(note_elem, "xml:lang", node.spec_attributes.language)
-    if node.spec_attributes.original_encoding is not None:
-      self.backend.set_attribute(note_elem, "o-encoding", node.spec_attributes.original_encoding)
-    self._add_extra(note_elem, node)
+    if spec.language is not None:
+      self.backend.set_attribute(note_elem, "xml:lang", spec.language)
+    if spec.original_encoding is not None:
+      self.backend.set_attribute(note_elem, "o-encoding", spec.original_encoding)
+    if node.extra_attributes or node.extra_nodes:
+      self._add_extra(note_elem, node)
 
     return note_elem
 
@@ -369,13 +378,13 @@ class TranslationMemoryHeaderDumper[BackendType](XmlDumper[BackendType, Translat
       self.backend.set_attribute(header_elem, "o-encoding", node.spec_attributes.original_encoding)
     if node.spec_attributes.created_at is not None:
       self.backend.set_attribute(
-        header_elem, "creationdate", node.spec_attributes.created_at.strftime("%Y%m%dT%H%M%SZ")
+        header_elem, "creationdate", _format_date(node.spec_attributes.created_at)
       )
     if node.spec_attributes.created_by is not None:
       self.backend.set_attribute(header_elem, "creationid", node.spec_attributes.created_by)
     if node.spec_attributes.last_modified_at is not None:
       self.backend.set_attribute(
-        header_elem, "changedate", node.spec_attributes.last_modified_at.strftime("%Y%m%dT%H%M%SZ")
+        header_elem, "changedate", _format_date(node.spec_attributes.last_modified_at)
       )
     if node.spec_attributes.last_modified_by is not None:
       self.backend.set_attribute(header_elem, "changeid", node.spec_attributes.last_modified_by)
@@ -500,7 +509,7 @@ class TranslationVariantDumper[BackendType](XmlDumper[BackendType, TranslationVa
       self.backend.set_attribute(variant_elem, "usagecount", str(node.spec_attributes.usage_count))
     if node.spec_attributes.last_used_at is not None:
       self.backend.set_attribute(
-        variant_elem, "lastusagedate", node.spec_attributes.last_used_at.strftime("%Y%m%dT%H%M%SZ")
+        variant_elem, "lastusagedate", _format_date(node.spec_attributes.last_used_at)
       )
     if node.spec_attributes.creation_tool is not None:
       self.backend.set_attribute(variant_elem, "creationtool", node.spec_attributes.creation_tool)
@@ -510,13 +519,13 @@ class TranslationVariantDumper[BackendType](XmlDumper[BackendType, TranslationVa
       )
     if node.spec_attributes.created_at is not None:
       self.backend.set_attribute(
-        variant_elem, "creationdate", node.spec_attributes.created_at.strftime("%Y%m%dT%H%M%SZ")
+        variant_elem, "creationdate", _format_date(node.spec_attributes.created_at)
       )
     if node.spec_attributes.created_by is not None:
       self.backend.set_attribute(variant_elem, "creationid", node.spec_attributes.created_by)
     if node.spec_attributes.last_modified_at is not None:
       self.backend.set_attribute(
-        variant_elem, "changedate", node.spec_attributes.last_modified_at.strftime("%Y%m%dT%H%M%SZ")
+        variant_elem, "changedate", _format_date(node.spec_attributes.last_modified_at)
       )
     if node.spec_attributes.last_modified_by is not None:
       self.backend.set_attribute(variant_elem, "changeid", node.spec_attributes.last_modified_by)
@@ -549,7 +558,7 @@ class TranslationUnitDumper[BackendType](XmlDumper[BackendType, TranslationUnit]
       self.backend.set_attribute(tu_elem, "usagecount", str(node.spec_attributes.usage_count))
     if node.spec_attributes.last_used_at is not None:
       self.backend.set_attribute(
-        tu_elem, "lastusagedate", node.spec_attributes.last_used_at.strftime("%Y%m%dT%H%M%SZ")
+        tu_elem, "lastusagedate", _format_date(node.spec_attributes.last_used_at)
       )
     if node.spec_attributes.creation_tool is not None:
       self.backend.set_attribute(tu_elem, "creationtool", node.spec_attributes.creation_tool)
@@ -559,13 +568,13 @@ class TranslationUnitDumper[BackendType](XmlDumper[BackendType, TranslationUnit]
       )
     if node.spec_attributes.created_at is not None:
       self.backend.set_attribute(
-        tu_elem, "creationdate", node.spec_attributes.created_at.strftime("%Y%m%dT%H%M%SZ")
+        tu_elem, "creationdate", _format_date(node.spec_attributes.created_at)
       )
     if node.spec_attributes.created_by is not None:
       self.backend.set_attribute(tu_elem, "creationid", node.spec_attributes.created_by)
     if node.spec_attributes.last_modified_at is not None:
       self.backend.set_attribute(
-        tu_elem, "changedate", node.spec_attributes.last_modified_at.strftime("%Y%m%dT%H%M%SZ")
+        tu_elem, "changedate", _format_date(node.spec_attributes.last_modified_at)
       )
     if node.spec_attributes.segmentation_type is not None:
       self.backend.set_attribute(tu_elem, "segtype", node.spec_attributes.segmentation_type.value)
@@ -578,8 +587,7 @@ class TranslationUnitDumper[BackendType](XmlDumper[BackendType, TranslationUnit]
 
     if node.variants:
       variant_dumper = self._get_dumper(TranslationVariant)
-      for variant in node.variants:
-        self.backend.append_child(tu_elem, variant_dumper.dump(variant))
+      self._append_children(tu_elem, map(variant_dumper.dump, node.variants))
 
     self._add_notes_and_props(tu_elem, node)
     self._add_extra(tu_elem, node)
@@ -603,9 +611,27 @@ class TranslationMemoryDumper[BackendType](XmlDumper[BackendType, TranslationMem
 
     if node.units:
       unit_dumper = self._get_dumper(TranslationUnit)
-      for unit in node.units:
-        self.backend.append_child(body_elem, unit_dumper.dump(unit))
+      self._append_children(body_elem, map(unit_dumper.dump, node.units))
 
     self._add_extra(tmx_elem, node)
 
     return tmx_elem
+
+
+_BUILTIN_DUMPERS: dict[type, type[XmlDumper[Any, Any]]] = {
+  Prop: PropDumper,
+  Note: NoteDumper,
+  TranslationMemoryHeader: TranslationMemoryHeaderDumper,
+  Bpt: BptDumper,
+  Ept: EptDumper,
+  It: ItDumper,
+  Ph: PhDumper,
+  Hi: HiDumper,
+  Sub: SubDumper,
+  TranslationVariant: TranslationVariantDumper,
+  TranslationUnit: TranslationUnitDumper,
+  TranslationMemory: TranslationMemoryDumper,
+  UnknownNode: UnknownNodeDumper,
+  UnknownInlineNode: UnknownInlineNodeDumper,
+}
+"""Builtin dumper class for each supported node type, instantiated lazily by `_get_dumper()`."""
@@ -36,6 +36,9 @@ from hypomnema.domain.nodes import (
 )
 
 
+_logger = getLogger(__name__)
+
+
 class UnknownNodeLoader[T]:
   """Load unsupported structural XML into `UnknownNode` payloads."""
 
@@ -43,7 +46,7 @@ class UnknownNodeLoader[T]:
   backend: XmlBackend[T]
 
   def __init__(self, backend: XmlBackend[T], logger: Logger | None = None) -> None:
-    self.logger = logger or getLogger(__name__)
+    self.logger = logger or _logger
     self.backend = backend
 
   def load(self, element: T) -> UnknownNode:
@@ -58,7 +61,7 @@ class UnknownInlineNodeLoader[T]:
   backend: XmlBackend[T]
 
   def __init__(self, backend: XmlBackend[T], logger: Logger | None = None) -> None:
-    self.logger = logger or getLogger(__name__)
+    self.logger = logger or _logger
     self.backend = backend
 
   def load(self, element: T) -> UnknownInlineNode:
@@ -93,7 +96,7 @@ class XmlLoader[T](ABC):
     logger: Logger | None = None,
     overrides: dict[str, XmlLoaderLike[T]] | None = None,
   ) -> None:
-    self.logger = logger or getLogger(__name__)
+    self.logger = logger or _logger
     self.backend = backend
     self._overrides = {}
     self._cache = {}
@@ -11,6 +11,14 @@ from hypomnema.backends.xml.errors import (
   UnregisteredPrefixError,
   UnregisteredURIError,
 )
+from hypomnema.backends.xml.lxml import LxmlBackend
+from hypomnema.backends.xml.standard import StandardBackend
+
+
+@pytest.fixture(params=[StandardBackend, LxmlBackend])
+def backend(request: pytest.FixtureRequest) -> StandardBackend | LxmlBackend:
+  """Fresh backend per test, as these tests mutate `global_nsmap`."""
+  return request.param()
 
 
 def _write_xml(tmp_path: Path, filename: str, xml: str) -> Path:
@@ -108,9 +116,6 @@ class TestNamespaceManagement:
       b.deregister_uri("http://missing.example.com")
 
   def test_global_nsmap_constructor(self) -> None:
-    from hypomnema.backends.xml.lxml import LxmlBackend
-    from hypomnema.backends.xml.standard import StandardBackend
-
     for cls in [StandardBackend, LxmlBackend]:
       b = cls(global_nsmap={"ns": "http://example.com/ns"})
       assert b.global_nsmap == {"ns": "http://example.com/ns"}
@@ -287,6 +292,57 @@ class TestIterChildren:
     b.append_child(parent, child)
     assert [b.get_tag(item, notation="local") for item in b.iter_children(parent)] == ["child"]
 
+  def test_extend_children_appends_in_order(self, backend: object) -> None:
+    from hypomnema.backends.xml.base import XmlBackend
+
+    b = backend
+    assert isinstance(b, XmlBackend)
+    root = b.create_element("root")
+    b.append_child(root, b.create_element("first"))
+    b.extend_children(root, (b.create_element(tag) for tag in ("second", "third")))
+    assert [b.get_tag(child, notation="local") for child in b.iter_children(root)] == [
+      "first",
+      "second",
+      "third",
+    ]
+
+  def test_extend_children_default_appends_in_order(self, backend: object) -> None:
+    from hypomnema.backends.xml.base import XmlBackend
+
+    assert isinstance(backend, XmlBackend)
+
+    class LegacyBackend(type(backend)):  # type: ignore[misc]
+      """Backend written against the API without `extend_children`."""
+
+      extend_children = XmlBackend.extend_children
+
+    b = LegacyBackend()
+    root = b.create_element("root")
+    b.append_child(root, b.create_element("first"))
+    b.extend_children(root, (b.create_element(tag) for tag in ("second", "third")))
+    assert [b.get_tag(child, notation="local") for child in b.iter_children(root)] == [
+      "first",
+      "second",
+      "third",
+    ]
+
+  def test_extend_children_routes_through_overridden_append_child(self, backend: object) -> None:
+    from hypomnema.backends.xml.base import XmlBackend
+
+    assert isinstance(backend, XmlBackend)
+    appended: list[str] = []
+
+    class RecordingBackend(type(backend)):  # type: ignore[misc]
+      def append_child(self, parent: object, child: object) -> None:
+        appended.append(self.get_tag(child, notation="local"))
+        super().append_child(parent, child)
+
+    b = RecordingBackend()
+    root = b.create_element("root")
+    b.extend_children(root, (b.create_element(tag) for tag in ("first", "second")))
+    assert appended == ["first", "second"]
+    assert [b.get_tag(child, notation="local") for child in b.iter_children(root)] == appended
+
   def test_iter_children_yields_in_order(self, backend: object) -> None:
     from hypomnema.backends.xml.base import XmlBackend
 
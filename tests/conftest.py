@@ -4,11 +4,15 @@ from hypomnema.backends.xml.lxml import LxmlBackend
 from hypomnema.backends.xml.standard import StandardBackend
 
 
-@pytest.fixture(params=[StandardBackend, LxmlBackend])
+@pytest.fixture(scope="session", params=[StandardBackend, LxmlBackend])
 def backend(request: pytest.FixtureRequest) -> StandardBackend | LxmlBackend:
   """Returns both StandardBackend and LxmlBackend for every test.
 
   This fixture parametrizes all tests to run against both backend
   implementations, ensuring backend equivalence.
+
+  Instances are shared for the whole session, so tests must not mutate backend
+  state such as the global namespace map. Modules that do override this
+  fixture with a fresh instance per test.
   """
   return request.param()
@@ -0,0 +1,65 @@
+import pytest
+
+from hypomnema.backends.xml.base import XmlBackend
+from hypomnema.domain.nodes import Hi, Note, TranslationUnit, TranslationVariant
+from hypomnema.dumpers.xml import HiDumper, NoteDumper, TranslationUnitDumper
+
+
+class ShoutingNoteDumper(NoteDumper[object]):
+  def dump(self, node: Note) -> object:
+    return super().dump(Note.create(text=node.text.upper()))
+
+
+def make_unit(*notes: str) -> TranslationUnit:
+  return TranslationUnit.create(
+    notes=[Note.create(text=text) for text in notes],
+    variants=[TranslationVariant.create(language="en", segment=["Hello"])],
+  )
+
+
+def note_texts(backend: XmlBackend[object], element: object) -> list[str | None]:
+  return [backend.get_text(note) for note in backend.iter_children(element, tag_filter="note")]
+
+
+def test_dumper_resolves_builtin_dumper(backend: XmlBackend[object]) -> None:
+  element = TranslationUnitDumper(backend).dump(make_unit("quiet"))
+
+  assert note_texts(backend, element) == ["quiet"]
+
+
+def test_dumper_reuses_resolved_dumper(
+  backend: XmlBackend[object], monkeypatch: pytest.MonkeyPatch
+) -> None:
+  created: list[NoteDumper[object]] = []
+  original_init = NoteDumper.__init__
+
+  def recording_init(self: NoteDumper[object], *args: object, **kwargs: object) -> None:
+    created.append(self)
+    original_init(self, *args, **kwargs)  # type: ignore[arg-type]
+
+  monkeypatch.setattr(NoteDumper, "__init__", recording_init)
+  dumper = TranslationUnitDumper(backend)
+  dumper.dump(make_unit("first", "second"))
+  dumper.dump(make_unit("third"))
+
+  assert len(created) == 1
+
+
+def test_dumper_rejects_unregistered_type(backend: XmlBackend[object]) -> None:
+  node = Hi.create(content=["lead", 42])  # type: ignore[list-item]
+
+  with pytest.raises(ValueError, match="No dumper registered for type <class 'int'>"):
+    HiDumper(backend).dump(node)
+
+
+def test_dumper_prefers_registered_override(backend: XmlBackend[object]) -> None:
+  dumper = TranslationUnitDumper(backend)
+  dumper.register_override(Note, ShoutingNoteDumper(backend))
+
+  assert note_texts(backend, dumper.dump(make_unit("quiet"))) == ["QUIET"]
+
+
+def test_dumper_uses_override_for_nested_nodes(backend: XmlBackend[object]) -> None:
+  dumper = TranslationUnitDumper(backend, overrides={Note: ShoutingNoteDumper(backend)})
+
+  assert note_texts(backend, dumper.dump(make_unit("quiet"))) == ["QUIET"]
@@ -1,85 +1,162 @@
-from hypomnema.backends.xml.base import XmlBackend
-from hypomnema.domain.nodes import Bpt, Hi, Ph, Sub
-from hypomnema.dumpers.xml import BptDumper, HiDumper
+from typing import Any
 
+import pytest
 
-def dump_bpt(backend: XmlBackend[object]) -> object:
+from hypomnema.backends.xml.base import XmlBackend
+from hypomnema.domain.attributes import Assoc
+from hypomnema.domain.nodes import Bpt, Ept, Hi, It, Ph, Sub
+from hypomnema.dumpers.xml import (
+  BptDumper,
+  EptDumper,
+  HiDumper,
+  ItDumper,
+  PhDumper,
+  SubDumper,
+  XmlDumper,
+)
+
+
+@pytest.fixture(scope="module")
+def bpt_element(backend: XmlBackend[object]) -> object:
   sub = Sub.create(content=["sub"], original_data_type="xml")
   return BptDumper(backend).dump(
     Bpt.create(content=["lead", sub, "tail"], internal_id=1, external_id=2, kind="fmt")
   )
 
 
-def dump_hi(backend: XmlBackend[object]) -> object:
+@pytest.fixture(scope="module")
+def hi_element(backend: XmlBackend[object]) -> object:
   placeholder = Ph.create(content=["ph"], kind="fmt")
   return HiDumper(backend).dump(
     Hi.create(content=["lead", placeholder, "tail"], external_id=9, kind="style")
   )
 
 
-def test_bpt_dumper_emits_bpt_tag(backend: XmlBackend[object]) -> None:
-  assert backend.get_tag(dump_bpt(backend)) == "bpt"
+def test_bpt_dumper_emits_bpt_tag(backend: XmlBackend[object], bpt_element: object) -> None:
+  assert backend.get_tag(bpt_element) == "bpt"
 
 
-def test_bpt_dumper_emits_internal_id_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_bpt(backend), "i") == "1"
+def test_bpt_dumper_emits_internal_id_attribute(
+  backend: XmlBackend[object], bpt_element: object
+) -> None:
+  assert backend.get_attribute(bpt_element, "i") == "1"
 
 
-def test_bpt_dumper_emits_external_id_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_bpt(backend), "x") == "2"
+def test_bpt_dumper_emits_external_id_attribute(
+  backend: XmlBackend[object], bpt_element: object
+) -> None:
+  assert backend.get_attribute(bpt_element, "x") == "2"
 
 
-def test_bpt_dumper_emits_kind_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_bpt(backend), "type") == "fmt"
+def test_bpt_dumper_emits_kind_attribute(backend: XmlBackend[object], bpt_element: object) -> None:
+  assert backend.get_attribute(bpt_element, "type") == "fmt"
 
 
-def test_bpt_dumper_emits_leading_text(backend: XmlBackend[object]) -> None:
-  assert backend.get_text(dump_bpt(backend)) == "lead"
+def test_bpt_dumper_emits_leading_text(backend: XmlBackend[object], bpt_element: object) -> None:
+  assert backend.get_text(bpt_element) == "lead"
 
 
-def test_bpt_dumper_emits_nested_sub_tag(backend: XmlBackend[object]) -> None:
-  assert backend.get_tag(next(backend.iter_children(dump_bpt(backend)))) == "sub"
+def test_bpt_dumper_emits_nested_sub_tag(backend: XmlBackend[object], bpt_element: object) -> None:
+  assert backend.get_tag(next(backend.iter_children(bpt_element))) == "sub"
 
 
-def test_bpt_dumper_emits_nested_sub_text(backend: XmlBackend[object]) -> None:
-  child = next(backend.iter_children(dump_bpt(backend)))
+def test_bpt_dumper_emits_nested_sub_text(backend: XmlBackend[object], bpt_element: object) -> None:
+  child = next(backend.iter_children(bpt_element))
 
   assert backend.get_text(child) == "sub"
 
 
-def test_bpt_dumper_emits_tail_after_nested_sub(backend: XmlBackend[object]) -> None:
-  child = next(backend.iter_children(dump_bpt(backend)))
+def test_bpt_dumper_emits_tail_after_nested_sub(
+  backend: XmlBackend[object], bpt_element: object
+) -> None:
+  child = next(backend.iter_children(bpt_element))
 
   assert backend.get_tail(child) == "tail"
 
 
-def test_hi_dumper_emits_hi_tag(backend: XmlBackend[object]) -> None:
-  assert backend.get_tag(dump_hi(backend)) == "hi"
+def test_hi_dumper_emits_hi_tag(backend: XmlBackend[object], hi_element: object) -> None:
+  assert backend.get_tag(hi_element) == "hi"
 
 
-def test_hi_dumper_emits_external_id_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_hi(backend), "x") == "9"
+def test_hi_dumper_emits_external_id_attribute(
+  backend: XmlBackend[object], hi_element: object
+) -> None:
+  assert backend.get_attribute(hi_element, "x") == "9"
 
 
-def test_hi_dumper_emits_kind_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_hi(backend), "type") == "style"
+def test_hi_dumper_emits_kind_attribute(backend: XmlBackend[object], hi_element: object) -> None:
+  assert backend.get_attribute(hi_element, "type") == "style"
 
 
-def test_hi_dumper_emits_leading_text(backend: XmlBackend[object]) -> None:
-  assert backend.get_text(dump_hi(backend)) == "lead"
+def test_hi_dumper_emits_leading_text(backend: XmlBackend[object], hi_element: object) -> None:
+  assert backend.get_text(hi_element) == "lead"
 
 
-def test_hi_dumper_emits_nested_ph_tag(backend: XmlBackend[object]) -> None:
-  assert backend.get_tag(next(backend.iter_children(dump_hi(backend)))) == "ph"
+def test_hi_dumper_emits_nested_ph_tag(backend: XmlBackend[object], hi_element: object) -> None:
+  assert backend.get_tag(next(backend.iter_children(hi_element))) == "ph"
 
 
-def test_hi_dumper_emits_nested_ph_text(backend: XmlBackend[object]) -> None:
-  child = next(backend.iter_children(dump_hi(backend)))
+def test_hi_dumper_emits_nested_ph_text(backend: XmlBackend[object], hi_element: object) -> None:
+  child = next(backend.iter_children(hi_element))
 
   assert backend.get_text(child) == "ph"
 
 
-def test_hi_dumper_emits_tail_after_nested_ph(backend: XmlBackend[object]) -> None:
-  child = next(backend.iter_children(dump_hi(backend)))
+def test_hi_dumper_emits_tail_after_nested_ph(
+  backend: XmlBackend[object], hi_element: object
+) -> None:
+  child = next(backend.iter_children(hi_element))
 
   assert backend.get_tail(child) == "tail"
+
+
+@pytest.mark.parametrize(
+  ("dumper_cls", "node", "tag"),
+  [
+    (BptDumper, Bpt.create(content=["code"], internal_id=1), "bpt"),
+    (EptDumper, Ept.create(content=["code"], internal_id=1), "ept"),
+    (ItDumper, It.create(content=["code"], position="begin"), "it"),
+    (PhDumper, Ph.create(content=["code"]), "ph"),
+    (HiDumper, Hi.create(content=["code"]), "hi"),
+    (SubDumper, Sub.create(content=["code"]), "sub"),
+  ],
+)
+def test_inline_dumper_emits_minimal_element(
+  backend: XmlBackend[object], dumper_cls: type[XmlDumper[object, Any]], node: object, tag: str
+) -> None:
+  element = dumper_cls(backend).dump(node)
+
+  assert (backend.get_tag(element), backend.get_text(element)) == (tag, "code")
+
+
+@pytest.mark.parametrize(
+  ("association", "expected"), [(Assoc.P, "p"), (Assoc.F, "f"), (Assoc.B, "b")]
+)
+def test_ph_dumper_emits_association_attribute(
+  backend: XmlBackend[object], association: Assoc, expected: str
+) -> None:
+  element = PhDumper(backend).dump(Ph.create(content=["ph"], association=association))
+
+  assert backend.get_attribute(element, "assoc") == expected
+
+
+@pytest.mark.parametrize(
+  ("content", "expected_text", "expected_children"),
+  [
+    pytest.param(["hello", " ", "world"], "hello world", [], id="text-only"),
+    pytest.param(
+      [Ph.create(content=["a"]), Ph.create(content=["b"])], None, ["ph", "ph"], id="nodes"
+    ),
+    pytest.param(["before ", Ph.create(content=["a"]), " after"], "before ", ["ph"], id="mixed"),
+  ],
+)
+def test_hi_dumper_serializes_content(
+  backend: XmlBackend[object],
+  content: list[str | Ph],
+  expected_text: str | None,
+  expected_children: list[str],
+) -> None:
+  element = HiDumper(backend).dump(Hi.create(content=content))
+
+  assert backend.get_text(element) == expected_text
+  assert [backend.get_tag(child) for child in backend.iter_children(element)] == expected_children
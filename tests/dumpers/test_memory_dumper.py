@@ -1,3 +1,5 @@
+import pytest
+
 from hypomnema.backends.xml.base import XmlBackend
 from hypomnema.domain.nodes import (
   TranslationMemory,
@@ -8,7 +10,8 @@ from hypomnema.domain.nodes import (
 from hypomnema.dumpers.xml import TranslationMemoryDumper
 
 
-def dump_memory(backend: XmlBackend[object]) -> object:
+@pytest.fixture(scope="module")
+def memory_element(backend: XmlBackend[object]) -> object:
   header = TranslationMemoryHeader.create(
     creation_tool="hypomnema",
     creation_tool_version="1.0",
@@ -27,35 +30,41 @@ def dump_memory(backend: XmlBackend[object]) -> object:
   )
 
 
-def test_memory_dumper_emits_tmx_tag(backend: XmlBackend[object]) -> None:
-  assert backend.get_tag(dump_memory(backend)) == "tmx"
+def test_memory_dumper_emits_tmx_tag(backend: XmlBackend[object], memory_element: object) -> None:
+  assert backend.get_tag(memory_element) == "tmx"
 
 
-def test_memory_dumper_emits_version_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_memory(backend), "version") == "1.4"
+def test_memory_dumper_emits_version_attribute(
+  backend: XmlBackend[object], memory_element: object
+) -> None:
+  assert backend.get_attribute(memory_element, "version") == "1.4"
 
 
-def test_memory_dumper_emits_header_as_first_child(backend: XmlBackend[object]) -> None:
-  assert [backend.get_tag(child) for child in backend.iter_children(dump_memory(backend))][
-    0
-  ] == "header"
+def test_memory_dumper_emits_header_as_first_child(
+  backend: XmlBackend[object], memory_element: object
+) -> None:
+  assert [backend.get_tag(child) for child in backend.iter_children(memory_element)][0] == "header"
 
 
-def test_memory_dumper_emits_body_as_second_child(backend: XmlBackend[object]) -> None:
-  assert [backend.get_tag(child) for child in backend.iter_children(dump_memory(backend))][
-    1
-  ] == "body"
+def test_memory_dumper_emits_body_as_second_child(
+  backend: XmlBackend[object], memory_element: object
+) -> None:
+  assert [backend.get_tag(child) for child in backend.iter_children(memory_element)][1] == "body"
 
 
-def test_memory_dumper_emits_unit_inside_body(backend: XmlBackend[object]) -> None:
-  children = list(backend.iter_children(dump_memory(backend)))
+def test_memory_dumper_emits_unit_inside_body(
+  backend: XmlBackend[object], memory_element: object
+) -> None:
+  children = list(backend.iter_children(memory_element))
   body = children[1]
 
   assert backend.get_tag(next(backend.iter_children(body))) == "tu"
 
 
-def test_memory_dumper_preserves_unit_id_inside_body(backend: XmlBackend[object]) -> None:
-  children = list(backend.iter_children(dump_memory(backend)))
+def test_memory_dumper_preserves_unit_id_inside_body(
+  backend: XmlBackend[object], memory_element: object
+) -> None:
+  children = list(backend.iter_children(memory_element))
   body = children[1]
   unit = next(backend.iter_children(body))
 
@@ -1,10 +1,13 @@
+import pytest
+
 from hypomnema.backends.xml.base import XmlBackend
 from hypomnema.domain.attributes import Segtype
 from hypomnema.domain.nodes import TranslationUnit, TranslationVariant
 from hypomnema.dumpers.xml import TranslationUnitDumper
 
 
-def dump_unit(backend: XmlBackend[object]) -> object:
+@pytest.fixture(scope="module")
+def unit_element(backend: XmlBackend[object]) -> object:
   variant = TranslationVariant.create(language="en", segment=["Hello"])
   node = TranslationUnit.create(
     translation_unit_id="tu-1",
@@ -18,46 +21,65 @@ def dump_unit(backend: XmlBackend[object]) -> object:
   return TranslationUnitDumper(backend).dump(node)
 
 
-def test_unit_dumper_emits_tu_tag(backend: XmlBackend[object]) -> None:
-  assert backend.get_tag(dump_unit(backend)) == "tu"
-
-
-def test_unit_dumper_emits_translation_unit_id_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_unit(backend), "tuid") == "tu-1"
+def test_unit_dumper_emits_tu_tag(backend: XmlBackend[object], unit_element: object) -> None:
+  assert backend.get_tag(unit_element) == "tu"
 
 
-def test_unit_dumper_emits_original_encoding_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_unit(backend), "o-encoding") == "utf-8"
+def test_unit_dumper_emits_attributes(backend: XmlBackend[object], unit_element: object) -> None:
+  assert backend.get_attribute_map(unit_element) == {
+    "tuid": "tu-1",
+    "o-encoding": "utf-8",
+    "datatype": "xml",
+    "usagecount": "4",
+    "segtype": "sentence",
+    "srclang": "fr",
+  }
 
 
-def test_unit_dumper_emits_original_data_type_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_unit(backend), "datatype") == "xml"
+def test_unit_dumper_emits_variant_child(backend: XmlBackend[object], unit_element: object) -> None:
+  assert backend.get_tag(next(backend.iter_children(unit_element))) == "tuv"
 
 
-def test_unit_dumper_emits_usage_count_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_unit(backend), "usagecount") == "4"
+def test_unit_dumper_emits_variant_seg_child(
+  backend: XmlBackend[object], unit_element: object
+) -> None:
+  variant = next(backend.iter_children(unit_element))
 
-
-def test_unit_dumper_emits_segmentation_type_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_unit(backend), "segtype") == "sentence"
+  assert backend.get_tag(next(backend.iter_children(variant))) == "seg"
 
 
-def test_unit_dumper_emits_source_language_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_unit(backend), "srclang") == "fr"
+def test_unit_dumper_emits_variant_segment_text(
+  backend: XmlBackend[object], unit_element: object
+) -> None:
+  variant = next(backend.iter_children(unit_element))
+  seg = next(backend.iter_children(variant))
 
+  assert backend.get_text(seg) == "Hello"
 
-def test_unit_dumper_emits_variant_child(backend: XmlBackend[object]) -> None:
-  assert backend.get_tag(next(backend.iter_children(dump_unit(backend)))) == "tuv"
 
+class ProtocolOnlyBackend:
+  """Proxy exposing the backend methods without inheriting from `XmlBackend`."""
 
-def test_unit_dumper_emits_variant_seg_child(backend: XmlBackend[object]) -> None:
-  variant = next(backend.iter_children(dump_unit(backend)))
+  def __init__(self, backend: XmlBackend[object]) -> None:
+    self._backend = backend
 
-  assert backend.get_tag(next(backend.iter_children(variant))) == "seg"
+  def __getattr__(self, name: str) -> object:
+    if name == "extend_children":
+      raise AttributeError(name)
+    return getattr(self._backend, name)
 
 
-def test_unit_dumper_emits_variant_segment_text(backend: XmlBackend[object]) -> None:
-  variant = next(backend.iter_children(dump_unit(backend)))
-  seg = next(backend.iter_children(variant))
+def test_unit_dumper_supports_protocol_only_backend(backend: XmlBackend[object]) -> None:
+  proxy = ProtocolOnlyBackend(backend)
+  node = TranslationUnit.create(
+    variants=[
+      TranslationVariant.create(language="en", segment=["Hello"]),
+      TranslationVariant.create(language="fr", segment=["Bonjour"]),
+    ]
+  )
+  element = TranslationUnitDumper(proxy).dump(node)  # type: ignore[arg-type]
 
-  assert backend.get_text(seg) == "Hello"
+  assert [backend.get_attribute(child, "xml:lang") for child in backend.iter_children(element)] == [
+    "en",
+    "fr",
+  ]
@@ -1,17 +1,26 @@
+from datetime import UTC, datetime
+
+import pytest
+
 from hypomnema.backends.xml.base import XmlBackend
+from hypomnema.backends.xml.namespace import XML_LANG_ATTR
 from hypomnema.domain.nodes import Note, Ph, Prop, TranslationVariant
 from hypomnema.dumpers.xml import TranslationVariantDumper
 
 
-def dump_variant(backend: XmlBackend[object]) -> object:
+@pytest.fixture(scope="module")
+def variant_element(backend: XmlBackend[object]) -> object:
   node = TranslationVariant.create(
     language="en",
     original_encoding="utf-8",
     original_data_type="html",
     usage_count=3,
+    last_used_at="2024-03-04T05:06:07",
     creation_tool="tool",
+    created_at="2024-03-01T01:02:03",
     creation_tool_version="1.0",
     created_by="creator",
+    last_modified_at="2024-03-05T06:07:08",
     last_modified_by="modifier",
     original_tm_format="legacy",
     notes=[Note.create(text="note")],
@@ -21,85 +30,102 @@ def dump_variant(backend: XmlBackend[object]) -> object:
   return TranslationVariantDumper(backend).dump(node)
 
 
-def test_variant_dumper_emits_tuv_tag(backend: XmlBackend[object]) -> None:
-  assert backend.get_tag(dump_variant(backend)) == "tuv"
-
-
-def test_variant_dumper_emits_language_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_variant(backend), "xml:lang") == "en"
-
-
-def test_variant_dumper_emits_original_encoding_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_variant(backend), "o-encoding") == "utf-8"
-
-
-def test_variant_dumper_emits_original_data_type_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_variant(backend), "datatype") == "html"
-
+def test_variant_dumper_emits_tuv_tag(backend: XmlBackend[object], variant_element: object) -> None:
+  assert backend.get_tag(variant_element) == "tuv"
 
-def test_variant_dumper_emits_usage_count_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_variant(backend), "usagecount") == "3"
 
+def test_variant_dumper_emits_attributes(
+  backend: XmlBackend[object], variant_element: object
+) -> None:
+  attributes = backend.get_attribute_map(variant_element)
 
-def test_variant_dumper_emits_creation_tool_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_variant(backend), "creationtool") == "tool"
+  assert {key: value for key, value in attributes.items() if not key.endswith("date")} == {
+    XML_LANG_ATTR: "en",
+    "o-encoding": "utf-8",
+    "datatype": "html",
+    "usagecount": "3",
+    "creationtool": "tool",
+    "creationtoolversion": "1.0",
+    "creationid": "creator",
+    "changeid": "modifier",
+    "o-tmf": "legacy",
+  }
 
 
-def test_variant_dumper_emits_creation_tool_version_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_variant(backend), "creationtoolversion") == "1.0"
+@pytest.mark.parametrize(
+  ("attribute", "expected"),
+  [
+    ("lastusagedate", "20240304T050607Z"),
+    ("creationdate", "20240301T010203Z"),
+    ("changedate", "20240305T060708Z"),
+  ],
+)
+def test_variant_dumper_emits_compact_date_attribute(
+  backend: XmlBackend[object], variant_element: object, attribute: str, expected: str
+) -> None:
+  assert backend.get_attribute(variant_element, attribute) == expected
 
 
-def test_variant_dumper_emits_created_by_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_variant(backend), "creationid") == "creator"
+def test_variant_dumper_emits_seg_as_first_child(
+  backend: XmlBackend[object], variant_element: object
+) -> None:
+  assert [backend.get_tag(child) for child in backend.iter_children(variant_element)][0] == "seg"
 
 
-def test_variant_dumper_emits_last_modified_by_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_variant(backend), "changeid") == "modifier"
+def test_variant_dumper_emits_note_after_seg(
+  backend: XmlBackend[object], variant_element: object
+) -> None:
+  assert [backend.get_tag(child) for child in backend.iter_children(variant_element)][1] == "note"
 
 
-def test_variant_dumper_emits_original_tm_format_attribute(backend: XmlBackend[object]) -> None:
-  assert backend.get_attribute(dump_variant(backend), "o-tmf") == "legacy"
+def test_variant_dumper_emits_prop_after_note(
+  backend: XmlBackend[object], variant_element: object
+) -> None:
+  assert [backend.get_tag(child) for child in backend.iter_children(variant_element)][2] == "prop"
 
 
-def test_variant_dumper_emits_seg_as_first_child(backend: XmlBackend[object]) -> None:
-  assert [backend.get_tag(child) for child in backend.iter_children(dump_variant(backend))][
-    0
-  ] == "seg"
-
-
-def test_variant_dumper_emits_note_after_seg(backend: XmlBackend[object]) -> None:
-  assert [backend.get_tag(child) for child in backend.iter_children(dump_variant(backend))][
-    1
-  ] == "note"
-
-
-def test_variant_dumper_emits_prop_after_note(backend: XmlBackend[object]) -> None:
-  assert [backend.get_tag(child) for child in backend.iter_children(dump_variant(backend))][
-    2
-  ] == "prop"
-
-
-def test_variant_dumper_emits_seg_leading_text(backend: XmlBackend[object]) -> None:
-  seg = next(backend.iter_children(dump_variant(backend)))
+def test_variant_dumper_emits_seg_leading_text(
+  backend: XmlBackend[object], variant_element: object
+) -> None:
+  seg = next(backend.iter_children(variant_element))
 
   assert backend.get_text(seg) == "lead"
 
 
-def test_variant_dumper_emits_seg_placeholder_tag(backend: XmlBackend[object]) -> None:
-  seg = next(backend.iter_children(dump_variant(backend)))
+def test_variant_dumper_emits_seg_placeholder_tag(
+  backend: XmlBackend[object], variant_element: object
+) -> None:
+  seg = next(backend.iter_children(variant_element))
 
   assert backend.get_tag(next(backend.iter_children(seg))) == "ph"
 
 
-def test_variant_dumper_emits_seg_placeholder_text(backend: XmlBackend[object]) -> None:
-  seg = next(backend.iter_children(dump_variant(backend)))
+def test_variant_dumper_emits_seg_placeholder_text(
+  backend: XmlBackend[object], variant_element: object
+) -> None:
+  seg = next(backend.iter_children(variant_element))
   placeholder = next(backend.iter_children(seg))
 
   assert backend.get_text(placeholder) == "ph"
 
 
-def test_variant_dumper_emits_text_after_placeholder(backend: XmlBackend[object]) -> None:
-  seg = next(backend.iter_children(dump_variant(backend)))
+def test_variant_dumper_emits_text_after_placeholder(
+  backend: XmlBackend[object], variant_element: object
+) -> None:
+  seg = next(backend.iter_children(variant_element))
   placeholder = next(backend.iter_children(seg))
 
   assert backend.get_tail(placeholder) == "tail"
+
+
+@pytest.mark.parametrize(
+  ("created_at", "expected"),
+  [pytest.param(datetime(999, 1, 2, 3, 4, 5, tzinfo=UTC), "09990102T030405Z", id="year<1000")],
+)
+def test_variant_dumper_formats_creation_date(
+  backend: XmlBackend[object], created_at: datetime, expected: str
+) -> None:
+  node = TranslationVariant.create(language="en", segment=["Hello"], created_at=created_at)
+  element = TranslationVariantDumper(backend).dump(node)
+
+  assert backend.get_attribute(element, "creationdate") == expected
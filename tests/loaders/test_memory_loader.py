@@ -1,35 +1,33 @@
-from pathlib import Path
-
 import pytest
 
 from hypomnema.backends.xml.base import XmlBackend
 from hypomnema.domain.attributes import Segtype
 from hypomnema.domain.nodes import TranslationMemory, UnknownNode
-from hypomnema.loaders.xml import TranslationMemoryLoader
+from hypomnema.loaders.xml import TranslationMemoryHeaderLoader, TranslationMemoryLoader, XmlLoader
 
 
-def parse_xml[T](backend: XmlBackend[T], tmp_path: Path, filename: str, xml: str) -> T:
-  path = tmp_path / filename
-  path.write_text(xml, encoding="utf-8")
-  return backend.parse(path)
+def parse_xml[T](backend: XmlBackend[T], xml: str) -> T:
+  return backend.from_string(xml)
 
 
-def parse_payload[T](backend: XmlBackend[T], tmp_path: Path, filename: str, payload: object) -> T:
-  path = tmp_path / filename
+def parse_payload[T](backend: XmlBackend[T], payload: object) -> T:
   assert isinstance(payload, bytes)
-  path.write_bytes(payload)
-  return backend.parse(path)
+  return backend.from_bytes(payload)
+
 
+HEADER = (
+  '<header creationtool="hypomnema" creationtoolversion="1.0" segtype="sentence" '
+  'o-tmf="tmx" adminlang="en" srclang="fr" datatype="plaintext" />'
+)
 
-def load_minimal_memory(backend: XmlBackend[object], tmp_path: Path) -> TranslationMemory:
+
+@pytest.fixture(scope="module")
+def minimal_memory(backend: XmlBackend[object]) -> TranslationMemory:
   element = parse_xml(
     backend,
-    tmp_path,
-    "memory-minimal.xml",
     (
       '<tmx version="1.4">'
-      '<header creationtool="hypomnema" creationtoolversion="1.0" segtype="sentence" '
-      'o-tmf="tmx" adminlang="en" srclang="fr" datatype="plaintext" />'
+      f"{HEADER}"
       '<body><tu><tuv xml:lang="en"><seg>Hello</seg></tuv></tu></body>'
       "</tmx>"
     ),
@@ -37,11 +35,10 @@ def load_minimal_memory(backend: XmlBackend[object], tmp_path: Path) -> Translat
   return TranslationMemoryLoader(backend).load(element)
 
 
-def load_rich_memory(backend: XmlBackend[object], tmp_path: Path) -> TranslationMemory:
+@pytest.fixture(scope="module")
+def rich_memory(backend: XmlBackend[object]) -> TranslationMemory:
   element = parse_xml(
     backend,
-    tmp_path,
-    "memory-rich.xml",
     (
       '<tmx version="1.5" custom="value">'
       '<extra-root source="external">keep me</extra-root>'
@@ -59,179 +56,125 @@ def load_rich_memory(backend: XmlBackend[object], tmp_path: Path) -> Translation
   return TranslationMemoryLoader(backend).load(element)
 
 
-def test_memory_loader_sets_version_from_minimal_input(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert load_minimal_memory(backend, tmp_path).spec_attributes.version == "1.4"
+def test_memory_loader_sets_version_from_minimal_input(minimal_memory: TranslationMemory) -> None:
+  assert minimal_memory.spec_attributes.version == "1.4"
 
 
-def test_memory_loader_loads_header_from_minimal_input(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert load_minimal_memory(backend, tmp_path).header.spec_attributes.creation_tool == "hypomnema"
+def test_memory_loader_loads_header_from_minimal_input(minimal_memory: TranslationMemory) -> None:
+  assert minimal_memory.header.spec_attributes.creation_tool == "hypomnema"
 
 
-def test_memory_loader_loads_header_segmentation_type(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert (
-    load_minimal_memory(backend, tmp_path).header.spec_attributes.segmentation_type
-    is Segtype.SENTENCE
-  )
+def test_memory_loader_loads_header_segmentation_type(minimal_memory: TranslationMemory) -> None:
+  assert minimal_memory.header.spec_attributes.segmentation_type is Segtype.SENTENCE
 
 
-def test_memory_loader_loads_units_from_minimal_input(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert len(load_minimal_memory(backend, tmp_path).units) == 1
+def test_memory_loader_loads_units_from_minimal_input(minimal_memory: TranslationMemory) -> None:
+  assert len(minimal_memory.units) == 1
 
 
 def test_memory_loader_loads_variant_segment_from_minimal_input(
-  backend: XmlBackend[object], tmp_path: Path
+  minimal_memory: TranslationMemory,
 ) -> None:
-  assert load_minimal_memory(backend, tmp_path).units[0].variants[0].segment == ["Hello"]
+  assert minimal_memory.units[0].variants[0].segment == ["Hello"]
 
 
 def test_memory_loader_defaults_extra_attributes_to_empty_dict(
-  backend: XmlBackend[object], tmp_path: Path
+  minimal_memory: TranslationMemory,
 ) -> None:
-  assert load_minimal_memory(backend, tmp_path).extra_attributes == {}
+  assert minimal_memory.extra_attributes == {}
 
 
 def test_memory_loader_defaults_extra_nodes_to_empty_list(
-  backend: XmlBackend[object], tmp_path: Path
+  minimal_memory: TranslationMemory,
 ) -> None:
-  assert load_minimal_memory(backend, tmp_path).extra_nodes == []
+  assert minimal_memory.extra_nodes == []
 
 
-def test_memory_loader_sets_version_from_rich_input(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert load_rich_memory(backend, tmp_path).spec_attributes.version == "1.5"
+def test_memory_loader_sets_version_from_rich_input(rich_memory: TranslationMemory) -> None:
+  assert rich_memory.spec_attributes.version == "1.5"
 
 
-def test_memory_loader_preserves_extra_attributes(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert load_rich_memory(backend, tmp_path).extra_attributes == {"custom": "value"}
+def test_memory_loader_preserves_extra_attributes(rich_memory: TranslationMemory) -> None:
+  assert rich_memory.extra_attributes == {"custom": "value"}
 
 
-def test_memory_loader_sets_header_segmentation_type(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert (
-    load_rich_memory(backend, tmp_path).header.spec_attributes.segmentation_type
-    is Segtype.PARAGRAPH
-  )
+def test_memory_loader_sets_header_segmentation_type(rich_memory: TranslationMemory) -> None:
+  assert rich_memory.header.spec_attributes.segmentation_type is Segtype.PARAGRAPH
 
 
-def test_memory_loader_sets_header_original_encoding(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert load_rich_memory(backend, tmp_path).header.spec_attributes.original_encoding == "utf-8"
+def test_memory_loader_sets_header_original_encoding(rich_memory: TranslationMemory) -> None:
+  assert rich_memory.header.spec_attributes.original_encoding == "utf-8"
 
 
-def test_memory_loader_loads_header_notes(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert [note.text for note in load_rich_memory(backend, tmp_path).header.notes] == ["header note"]
+def test_memory_loader_loads_header_notes(rich_memory: TranslationMemory) -> None:
+  assert [note.text for note in rich_memory.header.notes] == ["header note"]
 
 
-def test_memory_loader_loads_header_props(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert [prop.text for prop in load_rich_memory(backend, tmp_path).header.props] == ["finance"]
+def test_memory_loader_loads_header_props(rich_memory: TranslationMemory) -> None:
+  assert [prop.text for prop in rich_memory.header.props] == ["finance"]
 
 
-def test_memory_loader_loads_unit_ids(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert [
-    unit.spec_attributes.translation_unit_id for unit in load_rich_memory(backend, tmp_path).units
-  ] == ["tu-1"]
+def test_memory_loader_loads_unit_ids(rich_memory: TranslationMemory) -> None:
+  assert [unit.spec_attributes.translation_unit_id for unit in rich_memory.units] == ["tu-1"]
 
 
-def test_memory_loader_preserves_unknown_top_level_children(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  extra_nodes = load_rich_memory(backend, tmp_path).extra_nodes
+def test_memory_loader_preserves_unknown_top_level_children(rich_memory: TranslationMemory) -> None:
+  extra_nodes = rich_memory.extra_nodes
 
   assert len(extra_nodes) == 1
   assert isinstance(extra_nodes[0], UnknownNode)
 
 
 def test_memory_loader_preserves_unknown_top_level_payload_tag(
-  backend: XmlBackend[object], tmp_path: Path
+  backend: XmlBackend[object], rich_memory: TranslationMemory
 ) -> None:
-  payload = load_rich_memory(backend, tmp_path).extra_nodes[0].payload
+  payload = rich_memory.extra_nodes[0].payload
 
-  assert (
-    backend.get_tag(parse_payload(backend, tmp_path, "memory-extra-root.xml", payload))
-    == "extra-root"
-  )
+  assert backend.get_tag(parse_payload(backend, payload)) == "extra-root"
 
 
-def test_memory_loader_requires_header(backend: XmlBackend[object], tmp_path: Path) -> None:
-  element = parse_xml(
-    backend, tmp_path, "memory-missing-header.xml", '<tmx version="1.4"><body /></tmx>'
+def test_memory_loader_loads_every_unit_of_a_large_body(backend: XmlBackend[object]) -> None:
+  units = "".join(
+    f'<tu tuid="{i}"><tuv xml:lang="en"><seg>{i}</seg></tuv></tu>' for i in range(1000)
   )
-
-  with pytest.raises(ValueError, match="Missing <header> element"):
-    TranslationMemoryLoader(backend).load(element)
-
-
-def test_memory_loader_rejects_multiple_header_elements(
-  backend: XmlBackend[object], tmp_path: Path
+  element = parse_xml(backend, f'<tmx version="1.4">{HEADER}<body>{units}</body></tmx>')
+
+  memory = TranslationMemoryLoader(backend).load(element)
+
+  assert [unit.spec_attributes.translation_unit_id for unit in memory.units] == [
+    str(i) for i in range(1000)
+  ]
+
+
+@pytest.mark.parametrize(
+  ("children", "message"),
+  [
+    pytest.param("<body />", "Missing <header> element", id="no-header"),
+    pytest.param(HEADER + HEADER + "<body />", "Multiple <header> elements", id="two-headers"),
+    pytest.param(HEADER, "Missing <body> element", id="no-body"),
+    pytest.param(HEADER + "<body /><body />", "Multiple <body> elements", id="two-bodies"),
+  ],
+)
+def test_memory_loader_requires_single_header_and_body(
+  backend: XmlBackend[object], children: str, message: str
 ) -> None:
-  element = parse_xml(
-    backend,
-    tmp_path,
-    "memory-multiple-header.xml",
-    (
-      '<tmx version="1.4">'
-      '<header creationtool="a" creationtoolversion="1" segtype="sentence" o-tmf="tmx" adminlang="en" srclang="fr" datatype="txt" />'
-      '<header creationtool="b" creationtoolversion="1" segtype="sentence" o-tmf="tmx" adminlang="en" srclang="fr" datatype="txt" />'
-      "<body />"
-      "</tmx>"
-    ),
-  )
-
-  with pytest.raises(ValueError, match="Multiple <header> elements"):
-    TranslationMemoryLoader(backend).load(element)
-
-
-def test_memory_loader_requires_body(backend: XmlBackend[object], tmp_path: Path) -> None:
-  element = parse_xml(
-    backend,
-    tmp_path,
-    "memory-missing-body.xml",
-    (
-      '<tmx version="1.4">'
-      '<header creationtool="a" creationtoolversion="1" segtype="sentence" o-tmf="tmx" adminlang="en" srclang="fr" datatype="txt" />'
-      "</tmx>"
-    ),
-  )
+  element = parse_xml(backend, f'<tmx version="1.4">{children}</tmx>')
 
-  with pytest.raises(ValueError, match="Missing <body> element"):
+  with pytest.raises(ValueError, match=message):
     TranslationMemoryLoader(backend).load(element)
 
 
-def test_memory_loader_rejects_multiple_body_elements(
-  backend: XmlBackend[object], tmp_path: Path
+@pytest.mark.parametrize(
+  ("loader_cls", "tag"),
+  [
+    pytest.param(TranslationMemoryLoader, "tmx", id="tmx"),
+    pytest.param(TranslationMemoryHeaderLoader, "header", id="header"),
+  ],
+)
+def test_memory_loader_rejects_wrong_tag(
+  backend: XmlBackend[object], loader_cls: type[XmlLoader[object]], tag: str
 ) -> None:
-  element = parse_xml(
-    backend,
-    tmp_path,
-    "memory-multiple-body.xml",
-    (
-      '<tmx version="1.4">'
-      '<header creationtool="a" creationtoolversion="1" segtype="sentence" o-tmf="tmx" adminlang="en" srclang="fr" datatype="txt" />'
-      "<body />"
-      "<body />"
-      "</tmx>"
-    ),
-  )
-
-  with pytest.raises(ValueError, match="Multiple <body> elements"):
-    TranslationMemoryLoader(backend).load(element)
+  element = parse_xml(backend, "<body />")
 
-
-def test_memory_loader_rejects_wrong_tag(backend: XmlBackend[object], tmp_path: Path) -> None:
-  element = parse_xml(backend, tmp_path, "memory-wrong-tag.xml", "<body />")
-
-  with pytest.raises(ValueError, match="Expected <tmx> element"):
-    TranslationMemoryLoader(backend).load(element)
+  with pytest.raises(ValueError, match=f"Expected <{tag}> element but got 'body'"):
+    loader_cls(backend).load(element)
@@ -0,0 +1,102 @@
+import pytest
+
+from hypomnema.backends.xml.base import XmlBackend
+from hypomnema.domain.nodes import Note, Prop
+from hypomnema.loaders.xml import NoteLoader, PropLoader, XmlLoader
+
+
+def parse_xml[T](backend: XmlBackend[T], xml: str) -> T:
+  return backend.from_string(xml)
+
+
+@pytest.fixture(scope="module")
+def note_loader(backend: XmlBackend[object]) -> NoteLoader[object]:
+  return NoteLoader(backend)
+
+
+@pytest.fixture(scope="module")
+def prop_loader(backend: XmlBackend[object]) -> PropLoader[object]:
+  return PropLoader(backend)
+
+
+@pytest.mark.parametrize(
+  ("xml", "expected"),
+  [
+    pytest.param("<note>A note</note>", Note.create(text="A note"), id="minimal"),
+    pytest.param(
+      '<note xml:lang="en">A note</note>', Note.create(text="A note", language="en"), id="lang"
+    ),
+    pytest.param(
+      '<note o-encoding="utf-8">A note</note>',
+      Note.create(text="A note", original_encoding="utf-8"),
+      id="enc",
+    ),
+    pytest.param(
+      '<note xml:lang="en" o-encoding="utf-8">A note</note>',
+      Note.create(text="A note", language="en", original_encoding="utf-8"),
+      id="lang+enc",
+    ),
+  ],
+)
+def test_note_loader_loads_attributes(
+  backend: XmlBackend[object], note_loader: NoteLoader[object], xml: str, expected: Note
+) -> None:
+  assert note_loader.load(parse_xml(backend, xml)) == expected
+
+
+@pytest.mark.parametrize(
+  ("xml", "expected"),
+  [
+    pytest.param(
+      '<prop type="domain">finance</prop>', Prop.create(text="finance", kind="domain"), id="minimal"
+    ),
+    pytest.param(
+      '<prop type="domain" xml:lang="en">finance</prop>',
+      Prop.create(text="finance", kind="domain", language="en"),
+      id="lang",
+    ),
+    pytest.param(
+      '<prop type="domain" o-encoding="utf-8">finance</prop>',
+      Prop.create(text="finance", kind="domain", original_encoding="utf-8"),
+      id="enc",
+    ),
+    pytest.param(
+      '<prop type="domain" xml:lang="en" o-encoding="utf-8">finance</prop>',
+      Prop.create(text="finance", kind="domain", language="en", original_encoding="utf-8"),
+      id="lang+enc",
+    ),
+  ],
+)
+def test_prop_loader_loads_attributes(
+  backend: XmlBackend[object], prop_loader: PropLoader[object], xml: str, expected: Prop
+) -> None:
+  assert prop_loader.load(parse_xml(backend, xml)) == expected
+
+
+def test_prop_loader_requires_type(
+  backend: XmlBackend[object], prop_loader: PropLoader[object]
+) -> None:
+  element = parse_xml(backend, "<prop>finance</prop>")
+
+  with pytest.raises(ValueError, match="Missing attribute 'type' for <prop> element"):
+    prop_loader.load(element)
+
+
+@pytest.mark.parametrize(("loader_cls", "tag"), [(NoteLoader, "note"), (PropLoader, "prop")])
+def test_loader_requires_text(
+  backend: XmlBackend[object], loader_cls: type[XmlLoader[object]], tag: str
+) -> None:
+  element = parse_xml(backend, f'<{tag} type="domain"/>')
+
+  with pytest.raises(ValueError, match=f"Missing text content for <{tag}> element"):
+    loader_cls(backend).load(element)
+
+
+@pytest.mark.parametrize(("loader_cls", "tag"), [(NoteLoader, "note"), (PropLoader, "prop")])
+def test_loader_rejects_wrong_tag(
+  backend: XmlBackend[object], loader_cls: type[XmlLoader[object]], tag: str
+) -> None:
+  element = parse_xml(backend, '<seg type="domain">text</seg>')
+
+  with pytest.raises(ValueError, match=f"Expected <{tag}> element but got 'seg'"):
+    loader_cls(backend).load(element)
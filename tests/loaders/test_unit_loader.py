@@ -1,38 +1,32 @@
-from pathlib import Path
+from datetime import UTC, datetime
 
 import pytest
 
 from hypomnema.backends.xml.base import XmlBackend
 from hypomnema.domain.attributes import Segtype
-from hypomnema.domain.nodes import TranslationUnit, UnknownNode
+from hypomnema.domain.nodes import TranslationUnit, TranslationVariant, UnknownNode
 from hypomnema.loaders.xml import TranslationUnitLoader
 
 
-def parse_xml[T](backend: XmlBackend[T], tmp_path: Path, filename: str, xml: str) -> T:
-  path = tmp_path / filename
-  path.write_text(xml, encoding="utf-8")
-  return backend.parse(path)
+def parse_xml[T](backend: XmlBackend[T], xml: str) -> T:
+  return backend.from_string(xml)
 
 
-def parse_payload[T](backend: XmlBackend[T], tmp_path: Path, filename: str, payload: object) -> T:
-  path = tmp_path / filename
+def parse_payload[T](backend: XmlBackend[T], payload: object) -> T:
   assert isinstance(payload, bytes)
-  path.write_bytes(payload)
-  return backend.parse(path)
+  return backend.from_bytes(payload)
 
 
-def load_minimal_unit(backend: XmlBackend[object], tmp_path: Path) -> TranslationUnit:
-  element = parse_xml(
-    backend, tmp_path, "unit-minimal.xml", '<tu><tuv xml:lang="en"><seg>Hello</seg></tuv></tu>'
-  )
+@pytest.fixture(scope="module")
+def minimal_unit(backend: XmlBackend[object]) -> TranslationUnit:
+  element = parse_xml(backend, '<tu><tuv xml:lang="en"><seg>Hello</seg></tuv></tu>')
   return TranslationUnitLoader(backend).load(element)
 
 
-def load_rich_unit(backend: XmlBackend[object], tmp_path: Path) -> TranslationUnit:
+@pytest.fixture(scope="module")
+def rich_unit(backend: XmlBackend[object]) -> TranslationUnit:
   element = parse_xml(
     backend,
-    tmp_path,
-    "unit-rich.xml",
     (
       '<tu tuid="tu-1" o-encoding="utf-8" datatype="xml" usagecount="9" '
       'lastusagedate="2024-04-05T06:07:08" creationtool="tool" '
@@ -50,117 +44,112 @@ def load_rich_unit(backend: XmlBackend[object], tmp_path: Path) -> TranslationUn
   return TranslationUnitLoader(backend).load(element)
 
 
-def test_unit_loader_defaults_translation_unit_id_to_none(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert load_minimal_unit(backend, tmp_path).spec_attributes.translation_unit_id is None
+def test_unit_loader_defaults_translation_unit_id_to_none(minimal_unit: TranslationUnit) -> None:
+  assert minimal_unit.spec_attributes.translation_unit_id is None
 
 
-def test_unit_loader_loads_minimal_variant(backend: XmlBackend[object], tmp_path: Path) -> None:
-  unit = load_minimal_unit(backend, tmp_path)
+def test_unit_loader_loads_minimal_variant(minimal_unit: TranslationUnit) -> None:
+  assert minimal_unit.variants == [TranslationVariant.create(language="en", segment=["Hello"])]
 
-  assert len(unit.variants) == 1
-  assert unit.variants[0].segment == ["Hello"]
 
+def test_unit_loader_defaults_notes_to_empty_list(minimal_unit: TranslationUnit) -> None:
+  assert minimal_unit.notes == []
 
-def test_unit_loader_defaults_notes_to_empty_list(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert load_minimal_unit(backend, tmp_path).notes == []
 
+def test_unit_loader_defaults_props_to_empty_list(minimal_unit: TranslationUnit) -> None:
+  assert minimal_unit.props == []
 
-def test_unit_loader_defaults_props_to_empty_list(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert load_minimal_unit(backend, tmp_path).props == []
 
+def test_unit_loader_defaults_extra_attributes_to_empty_dict(minimal_unit: TranslationUnit) -> None:
+  assert minimal_unit.extra_attributes == {}
 
-def test_unit_loader_defaults_extra_attributes_to_empty_dict(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert load_minimal_unit(backend, tmp_path).extra_attributes == {}
 
+def test_unit_loader_defaults_extra_nodes_to_empty_list(minimal_unit: TranslationUnit) -> None:
+  assert minimal_unit.extra_nodes == []
 
-def test_unit_loader_defaults_extra_nodes_to_empty_list(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert load_minimal_unit(backend, tmp_path).extra_nodes == []
 
+def test_unit_loader_sets_translation_unit_id(rich_unit: TranslationUnit) -> None:
+  assert rich_unit.spec_attributes.translation_unit_id == "tu-1"
 
-def test_unit_loader_sets_translation_unit_id(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert load_rich_unit(backend, tmp_path).spec_attributes.translation_unit_id == "tu-1"
 
+def test_unit_loader_sets_original_encoding(rich_unit: TranslationUnit) -> None:
+  assert rich_unit.spec_attributes.original_encoding == "utf-8"
 
-def test_unit_loader_sets_original_encoding(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert load_rich_unit(backend, tmp_path).spec_attributes.original_encoding == "utf-8"
 
+def test_unit_loader_sets_original_data_type(rich_unit: TranslationUnit) -> None:
+  assert rich_unit.spec_attributes.original_data_type == "xml"
 
-def test_unit_loader_sets_original_data_type(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert load_rich_unit(backend, tmp_path).spec_attributes.original_data_type == "xml"
 
+def test_unit_loader_coerces_usage_count(rich_unit: TranslationUnit) -> None:
+  assert rich_unit.spec_attributes.usage_count == 9
 
-def test_unit_loader_coerces_usage_count(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert load_rich_unit(backend, tmp_path).spec_attributes.usage_count == 9
 
+def test_unit_loader_sets_segmentation_type(rich_unit: TranslationUnit) -> None:
+  assert rich_unit.spec_attributes.segmentation_type is Segtype.PARAGRAPH
 
-def test_unit_loader_sets_segmentation_type(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert load_rich_unit(backend, tmp_path).spec_attributes.segmentation_type is Segtype.PARAGRAPH
 
+def test_unit_loader_sets_source_language(rich_unit: TranslationUnit) -> None:
+  assert rich_unit.spec_attributes.source_language == "en-US"
 
-def test_unit_loader_sets_source_language(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert load_rich_unit(backend, tmp_path).spec_attributes.source_language == "en-US"
 
+def test_unit_loader_parses_creation_date(rich_unit: TranslationUnit) -> None:
+  assert rich_unit.spec_attributes.created_at == datetime(2024, 4, 1, 1, 2, 3, tzinfo=UTC)
 
-def test_unit_loader_preserves_extra_attributes(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  assert load_rich_unit(backend, tmp_path).extra_attributes == {"custom": "value"}
 
+def test_unit_loader_parses_compact_tmx_date(backend: XmlBackend[object]) -> None:
+  element = parse_xml(
+    backend, '<tu creationdate="20240401T010203Z"><tuv xml:lang="en"><seg>Hello</seg></tuv></tu>'
+  )
 
-def test_unit_loader_loads_note_children(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert [note.text for note in load_rich_unit(backend, tmp_path).notes] == ["unit note"]
+  assert TranslationUnitLoader(backend).load(element).spec_attributes.created_at == datetime(
+    2024, 4, 1, 1, 2, 3, tzinfo=UTC
+  )
 
 
-def test_unit_loader_loads_prop_children(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert [prop.text for prop in load_rich_unit(backend, tmp_path).props] == ["finance"]
+def test_unit_loader_preserves_extra_attributes(rich_unit: TranslationUnit) -> None:
+  assert rich_unit.extra_attributes == {"custom": "value"}
 
 
-def test_unit_loader_loads_variant_languages(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert [
-    variant.spec_attributes.language for variant in load_rich_unit(backend, tmp_path).variants
-  ] == ["en", "fr"]
+def test_unit_loader_loads_note_children(rich_unit: TranslationUnit) -> None:
+  assert [note.text for note in rich_unit.notes] == ["unit note"]
 
 
-def test_unit_loader_loads_variant_segments(backend: XmlBackend[object], tmp_path: Path) -> None:
-  assert [variant.segment for variant in load_rich_unit(backend, tmp_path).variants] == [
-    ["Source"],
-    ["Cible"],
-  ]
+def test_unit_loader_loads_prop_children(rich_unit: TranslationUnit) -> None:
+  assert [prop.text for prop in rich_unit.props] == ["finance"]
 
 
-def test_unit_loader_preserves_unknown_children(
-  backend: XmlBackend[object], tmp_path: Path
-) -> None:
-  extra_nodes = load_rich_unit(backend, tmp_path).extra_nodes
+def test_unit_loader_loads_variant_languages(rich_unit: TranslationUnit) -> None:
+  assert [variant.spec_attributes.language for variant in rich_unit.variants] == ["en", "fr"]
+
+
+def test_unit_loader_loads_variant_segments(rich_unit: TranslationUnit) -> None:
+  assert [variant.segment for variant in rich_unit.variants] == [["Source"], ["Cible"]]
+
+
+def test_unit_loader_preserves_unknown_children(rich_unit: TranslationUnit) -> None:
+  extra_nodes = rich_unit.extra_nodes
 
   assert len(extra_nodes) == 1
   assert isinstance(extra_nodes[0], UnknownNode)
 
 
 def test_unit_loader_preserves_unknown_child_payload_tag(
-  backend: XmlBackend[object], tmp_path: Path
+  backend: XmlBackend[object], rich_unit: TranslationUnit
 ) -> None:
-  payload = load_rich_unit(backend, tmp_path).extra_nodes[0].payload
+  payload = rich_unit.extra_nodes[0].payload
 
-  assert (
-    backend.get_tag(parse_payload(backend, tmp_path, "unit-extra.xml", payload)) == "extra-unit"
-  )
+  assert backend.get_tag(parse_payload(backend, payload)) == "extra-unit"
 
 
-def test_unit_loader_rejects_wrong_tag(backend: XmlBackend[object], tmp_path: Path) -> None:
-  element = parse_xml(
-    backend, tmp_path, "unit-wrong-tag.xml", '<tuv xml:lang="en"><seg>Hello</seg></tuv>'
-  )
+def test_unit_loader_rejects_wrong_tag(backend: XmlBackend[object]) -> None:
+  element = parse_xml(backend, '<tuv xml:lang="en"><seg>Hello</seg></tuv>')
 
   with pytest.raises(ValueError, match="Expected <tu> element"):
     TranslationUnitLoader(backend).load(element)
+
+
+def test_unit_loader_rejects_invalid_segmentation_type(backend: XmlBackend[object]) -> None:
+  element = parse_xml(backend, '<tu segtype="page"><tuv xml:lang="en"><seg>Hello</seg></tuv></tu>')
+
+  with pytest.raises(ValueError, match="'page' is not a valid Segtype"):
+    TranslationUnitLoader(backend).load(element)
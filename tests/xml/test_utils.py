@@ -55,6 +55,11 @@ class TestNormalizeEncoding:
     with pytest.raises(ValueError, match="Unknown encoding"):
       normalize_encoding("invalid-encoding-xyz")
 
+  def test_unknown_encoding_raises_on_every_call(self) -> None:
+    for _ in range(2):
+      with pytest.raises(ValueError, match="Unknown encoding"):
+        normalize_encoding("invalid-encoding-xyz")
+
   def test_empty_string_raises(self) -> None:
     with pytest.raises(ValueError, match="Unknown encoding"):
       normalize_encoding("")